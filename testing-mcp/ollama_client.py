@@ -68,7 +68,6 @@ def start_gateway(cmd=None):
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
                 )
             else:
                 print(f"🔁 Starting gateway (list) with: {cmd_to_use}")
@@ -77,7 +76,6 @@ def start_gateway(cmd=None):
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
                 )
         except Exception as e:
             print("⚠️ Failed to spawn gateway process:", e)
@@ -108,6 +106,9 @@ def start_gateway(cmd=None):
 def _read_gateway_response(timeout=30.0):
     """Read a Content-Length framed JSON-RPC response from gateway_proc.stdout with timeout.
     Returns the raw JSON string or None on timeout/error.
+
+    The pipe is binary so Content-Length is honoured as a byte count; the body
+    is decoded once after it has been read in full.
     """
     if gateway_proc is None or gateway_proc.stdout is None:
         return None
@@ -123,7 +124,7 @@ def _read_gateway_response(timeout=30.0):
                     # EOF or closed
                     q.put(None)
                     return
-                line = line.strip("\r\n")
+                line = line.decode("ascii", "replace").strip("\r\n")
                 if line == "":
                     break
                 parts = line.split(":", 1)
@@ -139,17 +140,17 @@ def _read_gateway_response(timeout=30.0):
             except Exception:
                 q.put(None)
                 return
-            # read exactly n characters
-            body = ""
+            # read exactly n bytes (collect chunks, join once)
+            chunks = []
             remaining = n
             while remaining > 0:
                 chunk = gateway_proc.stdout.read(remaining)
-                if chunk == "" or chunk is None:
+                if not chunk:
                     q.put(None)
                     return
-                body += chunk
-                remaining = n - len(body)
-            q.put(body)
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            q.put(b"".join(chunks).decode("utf-8"))
         except Exception:
             q.put(None)
 
@@ -231,8 +232,8 @@ def call_mcp(method, params):
     payload = request_json(method, params=params)  # JSON string
     # Compose Content-Length framed message (no extra newline after payload)
     payload_bytes = payload.encode("utf-8")
-    header = f"Content-Length: {len(payload_bytes)}\r\n\r\n"
-    message = header + payload
+    header = f"Content-Length: {len(payload_bytes)}\r\n\r\n".encode("ascii")
+    message = header + payload_bytes
 
     # Try twice: initial attempt, then restart gateway from config and retry if no response
     for attempt in range(2):